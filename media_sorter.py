@@ -1,18 +1,28 @@
 import os
 import sys
+import errno
 import shutil
 import time
 import json
 import threading
+import itertools
+import multiprocessing
+import queue
+import sqlite3
+from collections import Counter, deque
 import hashlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import mmap
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, Tuple, List, Dict
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 
 # Optional metadata libs
 try:
@@ -21,12 +31,38 @@ try:
 except Exception:
     PIL_OK = False
 
+try:
+    import exifread
+    import logging
+    logging.getLogger("exifread").setLevel(logging.ERROR)  # "no EXIF data" is normal, not a warning
+    EXIFREAD_OK = True
+except Exception:
+    EXIFREAD_OK = False
+
 try:
     from mutagen import File as MutagenFile
     MUTAGEN_OK = True
 except Exception:
     MUTAGEN_OK = False
 
+try:
+    import orjson
+    ORJSON_OK = True
+except Exception:
+    ORJSON_OK = False
+
+try:
+    import blake3
+    BLAKE3_OK = True
+except Exception:
+    BLAKE3_OK = False
+
+try:
+    import xxhash
+    XXHASH_OK = True
+except Exception:
+    XXHASH_OK = False
+
 # ---------------------------
 # Config
 # ---------------------------
@@ -37,11 +73,43 @@ VIDEO_EXTS = {
     ".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v", ".3gp"
 }
 SUPPORTED_EXTS = IMAGE_EXTS | VIDEO_EXTS
+# Formats exifread parses reliably (its WebP reader misreads VP8X files, so WebP goes to PIL)
+EXIFREAD_EXTS = {".jpg", ".jpeg", ".tiff", ".tif", ".heic", ".heif", ".png"}
+ISO_BMFF_EXTS = {".mp4", ".mov", ".m4v", ".3gp"}  # QuickTime/MP4 box layout: 'moov/mvhd' parsed directly
+MP4_EPOCH_OFFSET = 2082844800  # seconds from 1904-01-01 (QuickTime epoch) to 1970-01-01
 
 APP_TITLE = "Ragilmalik's Media Sorter -- Image & Video Organizer"
 INDEX_FILENAME = ".media_sorter_index.json"
-
-# Month names (Indonesian)
+HASH_CACHE_FILENAME = ".media_sorter_cache.db"  # source fingerprints/hashes, reused across runs
+INDEX_VERSION = 4  # bump when the fingerprint format changes (v1 stored MD5, v3 'size:hex' fingerprints)
+FP_ALGO = "blake3" if BLAKE3_OK else "sha256"  # OpenSSL's SHA-256 uses SHA-NI / ARMv8 crypto where present
+FULL_HASH_ALGO = "xxh3_128" if XXHASH_OK else FP_ALGO
+HASH_ALGO = f"{FP_ALGO}+{FULL_HASH_ALGO}"
+FP_PROBE_BYTES = 64 * 1024  # head/tail sample size for the cheap fingerprint
+MMAP_HASH_MIN = 1024 * 1024  # above this, BLAKE3 hashes via its multithreaded mmap path
+PROGRESS_INTERVAL = 1 / 30  # seconds between coalesced progress/status signals (~30 Hz cap)
+METADATA_MP_MIN_FILES = 1000  # below this, spawning metadata processes costs more than it saves
+METADATA_MAX_PROCS = 16
+METADATA_CHUNK = 32  # files per process-pool task
+METADATA_CHUNKS_PER_PROC = 2  # tasks in flight per process; nothing more is queued while paused
+
+# Log row layout: SortWorker.rows holds tuples in this column order
+LOG_HEADERS = (
+    "Timestamp", "Source folder", "Destination Folder", "Filename", "New Filename",
+    "Creation Date", "Creation Time", "Action", "Size (bytes)", "Width", "Height",
+    "Duration (sec)", "Camera Make", "Camera Model", "Lens", "GPS Lat", "GPS Lon", "Duplicate Of",
+)
+COL = {name: i for i, name in enumerate(LOG_HEADERS)}
+
+# Month names (fixed tables: strftime("%B") follows the process locale, which Qt sets)
+EN_MONTHS = {
+    1: "January", 2: "February", 3: "March", 4: "April", 5: "May", 6: "June",
+    7: "July", 8: "August", 9: "September", 10: "October", 11: "November", 12: "December"
+}
+EN_MONTHS_ABBR = {
+    1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun",
+    7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"
+}
 ID_MONTHS = {
     1: "Januari", 2: "Februari", 3: "Maret", 4: "April", 5: "Mei", 6: "Juni",
     7: "Juli", 8: "Agustus", 9: "September", 10: "Oktober", 11: "November", 12: "Desember"
@@ -72,7 +140,7 @@ QPushButton:disabled { color: #6B7280; border-color: #1F2937; }
 QCheckBox, QLabel { color: #FFFFFF; }
 QProgressBar { background: #0A0A0A; border: 1px solid #1F2937; border-radius: 8px; text-align: center; color: #FFFFFF; }
 QProgressBar::chunk { background-color: #FFFFFF; } /* neutral fill to honor 'outline-only' accent rule */
-QTableWidget { gridline-color: #0EA5A4; } /* cyan outline for table grid */
+QTableView { gridline-color: #0EA5A4; } /* cyan outline for table grid */
 QHeaderView::section { background: #0B0B0B; color: #FFFFFF; border: 0px; padding: 8px 10px; }
 """
 
@@ -94,7 +162,7 @@ QPushButton:disabled { color: #9AA0A6; border-color: #E5E7EB; }
 QCheckBox, QLabel { color: #000000; }
 QProgressBar { background: #F3F4F6; border: 1px solid #E5E7EB; border-radius: 8px; text-align: center; color: #000000; }
 QProgressBar::chunk { background-color: #000000; } /* neutral fill */
-QTableWidget { gridline-color: #2563EB; } /* blue outline for table grid */
+QTableView { gridline-color: #2563EB; } /* blue outline for table grid */
 QHeaderView::section { background: #EEF2FF; color: #000000; border: 0px; padding: 8px 10px; }
 """
 
@@ -102,10 +170,52 @@ QHeaderView::section { background: #EEF2FF; color: #000000; border: 0px; padding
 # Helpers
 # ---------------------------
 
-def is_media_file(path: Path) -> bool:
-    return path.is_file() and path.suffix.lower() in SUPPORTED_EXTS
+def is_media_file(ext: str) -> bool:
+    """`ext` is the lowercased extension including the dot (see SortWorker._collect_files)."""
+    return ext in SUPPORTED_EXTS
+
+def _scandir_walk(root: str, recursive: bool):
+    """Yield DirEntry objects for files under root; directory symlinks are not followed (like os.walk).
+
+    Hidden subfolders (".thumbnails", ".git", ...) are pruned without being opened.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            yield entry
+                        elif recursive and entry.name[0] != "." and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+def _is_slow_target(path: str) -> bool:
+    """True for network shares and rotational disks (best effort, False when unknown)."""
+    if path.startswith("\\\\"):
+        return True
+    try:
+        if os.name == "nt":
+            import ctypes
+            drive = os.path.splitdrive(os.path.abspath(path))[0] + "\\"
+            return ctypes.windll.kernel32.GetDriveTypeW(ctypes.c_wchar_p(drive)) == 4  # DRIVE_REMOTE
+        if sys.platform.startswith("linux"):
+            dev = os.stat(path).st_dev
+            base = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+            # Whole disks have queue/ directly; partitions inherit it from the parent disk
+            for p in (f"{base}/queue/rotational", f"{base}/../queue/rotational"):
+                if os.path.exists(p):
+                    with open(p) as f:
+                        return f.read().strip() == "1"
+    except Exception:
+        pass
+    return False
 
-def to_long_path(path: Path) -> str:
+def to_long_path(path) -> str:
     """Return a Windows long-path-safe string; on other OS returns str(path)."""
     s = str(path)
     if os.name == "nt":
@@ -118,33 +228,208 @@ def to_long_path(path: Path) -> str:
             s = "\\\\?\\" + s
     return s
 
-def ensure_unique_path(dest_path: Path) -> Path:
+# ---- Zero-copy file copy ----
+
+COPY_BLOCK = 64 * 1024 * 1024
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+_libc = None
+
+def _copy_file_ex_w(src: str, dst: str) -> bool:
+    """Windows CopyFileExW; handles long-path prefixes and server-side SMB copies."""
+    try:
+        import ctypes
+        return bool(ctypes.windll.kernel32.CopyFileExW(
+            ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), None, None, None, 0))
+    except Exception:
+        return False
+
+def _clonefile(src: str, dst: str) -> bool:
+    """macOS clonefile(2): instant copy-on-write clone on APFS (same volume only)."""
+    global _libc
+    try:
+        import ctypes, ctypes.util
+        if _libc is None:
+            _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        return _libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    except Exception:
+        return False
+
+def _kernel_copy(fsrc, fdst) -> int:
+    """copy_file_range (reflinks on XFS/Btrfs), then sendfile, then a plain buffered loop.
+
+    Returns the number of bytes written. A 0 on the very first kernel call is not
+    trusted as EOF (some FUSE/network mounts return it instead of an error): the
+    next method is tried, as CPython's shutil does.
+    """
+    sfd, dfd = fsrc.fileno(), fdst.fileno()
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while True:
+                n = os.copy_file_range(sfd, dfd, COPY_BLOCK)
+                if n == 0:
+                    if copied: return copied
+                    break
+                copied += n
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS: raise
+    if sys.platform.startswith("linux"):
+        try:
+            while True:
+                n = os.sendfile(dfd, sfd, copied, COPY_BLOCK)
+                if n == 0:
+                    if copied: return copied
+                    break
+                copied += n
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS: raise
+    fsrc.seek(copied); fdst.seek(copied)
+    shutil.copyfileobj(fsrc, fdst, 4 * 1024 * 1024)
+    return fdst.tell()
+
+def _fadvise(f, advice: str):
+    """posix_fadvise over the whole file where supported (Linux/BSD); no-op elsewhere."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+        except (OSError, AttributeError):
+            pass
+
+def _fast_copy(src: str, dst: str, size: int):
+    """Copy contents and metadata (like shutil.copy2) using the platform's fastest primitive.
+
+    Raises OSError, and removes the partial `dst`, unless exactly `size` bytes ended up there.
+    """
+    try:
+        if (os.name == "nt" and _copy_file_ex_w(src, dst)) or (sys.platform == "darwin" and _clonefile(src, dst)):
+            copied = os.stat(dst).st_size
+        else:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                _fadvise(fsrc, "POSIX_FADV_SEQUENTIAL")
+                copied = _kernel_copy(fsrc, fdst)
+                # Media is copied once and not read again: keep it from evicting hot pages
+                _fadvise(fsrc, "POSIX_FADV_DONTNEED")
+                _fadvise(fdst, "POSIX_FADV_DONTNEED")
+            shutil.copystat(src, dst)  # timestamps, permission bits, flags and xattrs, as copy2 does
+        if copied != size:
+            raise OSError(errno.EIO, f"Incomplete copy ({copied} of {size} bytes)", dst)
+    except BaseException:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        raise
+
+def ensure_unique_path(dest_path: str) -> str:
     """If dest_path exists, append (1), (2), ... before the suffix."""
-    if not dest_path.exists():
+    if not os.path.exists(dest_path):
         return dest_path
-    stem = dest_path.stem
-    suffix = dest_path.suffix
-    parent = dest_path.parent
+    stem, suffix = os.path.splitext(dest_path)
     i = 1
     while True:
-        candidate = parent / f"{stem} ({i}){suffix}"
-        if not candidate.exists():
+        candidate = f"{stem} ({i}){suffix}"
+        if not os.path.exists(candidate):
             return candidate
         i += 1
 
 # ---- EXIF & metadata ----
 
+def _parse_exif_dt_fast(s: str) -> Optional[datetime]:
+    """Fixed-offset parse of 'YYYY:MM:DD HH:MM:SS' (or ISO 'YYYY-MM-DDTHH:MM:SS'); trailing zone is ignored."""
+    if len(s) < 19 or s[4] not in ":-" or s[7] not in ":-" or s[10] not in " T" or s[13] != ":" or s[16] != ":":
+        return None
+    try:
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]))
+    except ValueError:
+        return None
+
 def parse_exif_datetime(dt_str: str) -> Optional[datetime]:
+    dt_str = dt_str.strip()
+    dt = _parse_exif_dt_fast(dt_str)
+    if dt:
+        return dt
     for fmt in ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y:%m:%d %H:%M:%S%z"):
         try:
-            return datetime.strptime(dt_str.strip(), fmt).replace(tzinfo=None)
+            return datetime.strptime(dt_str, fmt).replace(tzinfo=None)
         except Exception:
             continue
     return None
 
-def read_image_metadata(p: Path) -> Dict[str, Optional[object]]:
+def _jpeg_size(f) -> Optional[Tuple[int, int]]:
+    """Width/height from the first JPEG SOFn segment, without decoding anything."""
+    f.seek(2)
+    while True:
+        b = f.read(1)
+        while b and b != b"\xff": b = f.read(1)
+        while b == b"\xff": b = f.read(1)
+        if not b: return None
+        marker = b[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8: continue  # standalone markers
+        if marker in (0xD9, 0xDA): return None  # EOI / start of scan before any SOF
+        hdr = f.read(2)
+        if len(hdr) < 2: return None
+        seg_len = struct.unpack(">H", hdr)[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            data = f.read(5)  # precision, height, width
+            if len(data) < 5: return None
+            height, width = struct.unpack(">HH", data[1:5])
+            return width, height
+        f.seek(seg_len - 2, 1)
+
+def _image_size(f) -> Optional[Tuple[int, int]]:
+    """Width/height for JPEG (SOF marker) and PNG (IHDR); None for other formats."""
+    head = f.read(24)
+    if head[:2] == b"\xff\xd8":
+        return _jpeg_size(f)
+    if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+        return struct.unpack(">II", head[16:24])
+    return None
+
+def _exif_str(tags: dict, *names: str) -> Optional[str]:
+    for name in names:
+        tag = tags.get(name)
+        if tag is not None:
+            v = str(tag).strip().strip("\x00").strip()
+            if v: return v
+    return None
+
+def _read_image_metadata_exifread(p: str, md: Dict[str, Optional[object]], ext: str = "") -> bool:
+    """Fill md from the EXIF block only (no image decoding); returns False if the file couldn't be parsed."""
+    try:
+        with open(p, "rb") as f:
+            size = _image_size(f)
+            if size:
+                md["width"], md["height"] = size
+            f.seek(0)
+            # LensModel is the last tag we need in the EXIF IFD; stop parsing there
+            tags = exifread.process_file(f, details=False, extract_thumbnail=False, stop_tag="LensModel")
+    except Exception:
+        return False
+    if not tags and ext in (".heic", ".heif"):
+        return False  # exifread opened but did not understand the container: let PIL try
+    dt_str = _exif_str(tags, "EXIF DateTimeOriginal", "EXIF DateTimeDigitized", "Image DateTime")
+    if dt_str:
+        md["date_taken"] = parse_exif_datetime(dt_str)
+    md["camera_make"] = _exif_str(tags, "Image Make")
+    md["camera_model"] = _exif_str(tags, "Image Model")
+    md["lens"] = _exif_str(tags, "EXIF LensModel", "EXIF LensMake")
+    return True
+
+def read_image_metadata(p: str, ext: Optional[str] = None) -> Dict[str, Optional[object]]:
     md: Dict[str, Optional[object]] = {"width": None, "height": None, "camera_make": None, "camera_model": None,
           "lens": None, "gps_lat": None, "gps_lon": None, "date_taken": None}
+    if ext is None:
+        ext = os.path.splitext(p)[1].lower()
+    # Files exifread parsed but without a date are final: PIL's getexif() would decode EXIF-less PNGs
+    if EXIFREAD_OK and ext in EXIFREAD_EXTS and _read_image_metadata_exifread(p, md, ext):
+        if md["width"] is None and PIL_OK:
+            # No cheap header parser for this format: PIL reads the size from the header (no decode)
+            try:
+                with Image.open(p) as img:
+                    md["width"], md["height"] = img.size
+            except Exception:
+                pass
+        return md
     if not PIL_OK:
         return md
     try:
@@ -158,9 +443,9 @@ def read_image_metadata(p: Path) -> Dict[str, Optional[object]]:
                         if dt:
                             md["date_taken"] = dt
                             break
-                md["camera_make"] = exif.get(271)
-                md["camera_model"] = exif.get(272)
-                md["lens"] = exif.get(42036) or exif.get(42035)
+                md["camera_make"] = exif.get(271) or md["camera_make"]
+                md["camera_model"] = exif.get(272) or md["camera_model"]
+                md["lens"] = exif.get(42036) or exif.get(42035) or md["lens"]
             except Exception:
                 pass
     except Exception:
@@ -175,16 +460,63 @@ def parse_mp4_mov_datetime(tags: dict) -> Optional[datetime]:
             continue
         if isinstance(v, list):
             v = v[0]
-        v = str(v)
+        v = str(v).strip()
+        dt = _parse_exif_dt_fast(v)
+        if dt:
+            return dt
         for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
             try:
-                return datetime.strptime(v.strip(), fmt).replace(tzinfo=None)
+                return datetime.strptime(v, fmt).replace(tzinfo=None)
             except Exception:
                 continue
     return None
 
-def read_video_metadata(p: Path) -> Dict[str, Optional[object]]:
+def _read_mvhd(f) -> Tuple[Optional[datetime], Optional[float]]:
+    """Creation time (UTC in the file, returned as local time) and duration from 'moov/mvhd'.
+
+    Only box headers are read while seeking; mdat is skipped wherever moov sits.
+    """
+    end = os.fstat(f.fileno()).st_size
+    pos = 0; want = b"moov"
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        hdr_len = 8
+        if size == 1:  # 64-bit largesize
+            size = struct.unpack(">Q", f.read(8))[0]; hdr_len = 16
+        elif size == 0:  # box runs to the end of the file
+            size = end - pos
+        if size < hdr_len: break
+        if kind == want:
+            if kind == b"moov":  # descend into moov's children
+                end = min(end, pos + size); pos += hdr_len; want = b"mvhd"
+                continue
+            data = f.read(32)  # version/flags, then v0 32-bit or v1 64-bit times
+            if data[:1] == b"\x01":
+                created, _, timescale, duration = struct.unpack(">QQIQ", data[4:32])
+            else:
+                created, _, timescale, duration = struct.unpack(">IIII", data[4:20])
+            dt = None
+            if created > MP4_EPOCH_OFFSET:
+                try:
+                    dt = datetime.fromtimestamp(created - MP4_EPOCH_OFFSET)
+                except (OverflowError, OSError, ValueError):
+                    pass
+            return dt, (duration / timescale if timescale else None)
+        pos += size
+    return None, None
+
+def read_video_metadata(p: str, ext: Optional[str] = None) -> Dict[str, Optional[object]]:
+    """Duration and date taken: raw 'mvhd' box for MP4/MOV, mutagen for other formats or missing values."""
     md: Dict[str, Optional[object]] = {"duration": None, "date_taken": None}
+    if (ext or os.path.splitext(p)[1].lower()) in ISO_BMFF_EXTS:
+        try:
+            with open(p, "rb") as f:
+                md["date_taken"], md["duration"] = _read_mvhd(f)
+        except (OSError, struct.error):
+            pass
+        if md["date_taken"] and md["duration"] is not None:
+            return md
     if not MUTAGEN_OK:
         return md
     try:
@@ -192,7 +524,7 @@ def read_video_metadata(p: Path) -> Dict[str, Optional[object]]:
         if f is None:
             return md
         try:
-            md["duration"] = getattr(f.info, "length", None)
+            md["duration"] = getattr(f.info, "length", None) or md["duration"]
         except Exception:
             pass
         tags = {}
@@ -208,49 +540,107 @@ def read_video_metadata(p: Path) -> Dict[str, Optional[object]]:
         pass
     return md
 
-def safe_get_creation_dt(p: Path) -> datetime:
-    """Filesystem times: creation (if any) else modified."""
-    try:
-        ctime = p.stat().st_ctime
-    except Exception:
-        ctime = 0
+def safe_get_creation_dt(p: str, st: Optional[os.stat_result] = None) -> datetime:
+    """Filesystem times: creation (st_birthtime, or st_ctime on Windows) else modified.
+
+    On Linux st_ctime is the inode change time, not creation, so it is not used there.
+    Pass `st` to reuse an existing stat.
+    """
     try:
-        mtime = p.stat().st_mtime
+        if st is None:
+            st = os.stat(p)
     except Exception:
-        mtime = time.time()
-    ts = ctime if ctime and ctime > 0 else mtime
-    return datetime.fromtimestamp(ts)
+        return datetime.fromtimestamp(time.time())
+    bt = getattr(st, "st_birthtime", 0) or (st.st_ctime if os.name == "nt" else 0)
+    return datetime.fromtimestamp(bt if bt and bt > 0 else st.st_mtime)
 
-def best_creation_datetime(p: Path) -> Tuple[datetime, Dict[str, Optional[object]]]:
+def best_creation_datetime(
+    p: str, st: Optional[os.stat_result] = None, ext: Optional[str] = None
+) -> Tuple[datetime, Dict[str, Optional[object]]]:
     """Return best guess of date taken and extra metadata."""
-    ext = p.suffix.lower()
+    if ext is None:
+        ext = os.path.splitext(p)[1].lower()
     base_meta: Dict[str, Optional[object]] = {
         "width": None, "height": None, "camera_make": None, "camera_model": None,
         "lens": None, "gps_lat": None, "gps_lon": None, "duration": None,
     }
     if ext in IMAGE_EXTS:
-        imd = read_image_metadata(p)
+        imd = read_image_metadata(p, ext)
         base_meta.update({k: imd.get(k) for k in ("width", "height", "camera_make", "camera_model", "lens")})
-        dt = imd.get("date_taken") or safe_get_creation_dt(p)
+        dt = imd.get("date_taken") or safe_get_creation_dt(p, st)
         return dt, base_meta
     if ext in VIDEO_EXTS:
-        vmd = read_video_metadata(p)
+        vmd = read_video_metadata(p, ext)
         base_meta["duration"] = vmd.get("duration")
-        dt = vmd.get("date_taken") or safe_get_creation_dt(p)
+        dt = vmd.get("date_taken") or safe_get_creation_dt(p, st)
         return dt, base_meta
-    return safe_get_creation_dt(p), base_meta
+    return safe_get_creation_dt(p, st), base_meta
+
+def _metadata_task(args):
+    """best_creation_datetime for (path, stat, ext), or None on failure."""
+    try:
+        return best_creation_datetime(*args)
+    except Exception:
+        return None
 
-# ---- MD5 for exact duplicates ----
+def _metadata_chunk(batch):
+    """Process-pool entry point: one result per (path, stat, ext) in batch."""
+    return [_metadata_task(args) for args in batch]
 
-def file_md5(path: Path, chunk_size: int = 2 * 1024 * 1024) -> str:
-    h = hashlib.md5()
+# ---- Fingerprints for exact duplicates ----
+
+def _new_hasher(data: bytes = b"", threaded: bool = False):
+    if BLAKE3_OK:
+        if threaded:
+            return blake3.blake3(data, max_threads=blake3.blake3.AUTO)
+        return blake3.blake3(data)
+    return hashlib.sha256(data)
+
+def _read_head_tail(path, size: int) -> Tuple[bytes, bytes]:
+    """First and last FP_PROBE_BYTES of a file via one raw fd (pread where available, no buffered file object)."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        tail_off = max(FP_PROBE_BYTES, size - FP_PROBE_BYTES)
+        if hasattr(os, "pread"):
+            head = os.pread(fd, FP_PROBE_BYTES, 0)
+            tail = os.pread(fd, FP_PROBE_BYTES, tail_off) if size > FP_PROBE_BYTES else b""
+        else:
+            head = os.read(fd, FP_PROBE_BYTES)
+            tail = b""
+            if size > FP_PROBE_BYTES:
+                os.lseek(fd, tail_off, os.SEEK_SET)
+                tail = os.read(fd, FP_PROBE_BYTES)
+    finally:
+        os.close(fd)
+    return head, tail
+
+def _fast_fingerprint(path, size: int) -> bytes:
+    """Cheap stage-1 key: 8-byte size + raw digest of the first and last 64 KiB."""
+    head, tail = _read_head_tail(path, size)
+    h = _new_hasher(head)
+    h.update(tail)
+    return size.to_bytes(8, "little") + h.digest()
+
+def file_full_hash(path) -> bytes:
+    """Stage-2 full-content hash, only computed when fingerprints collide.
+
+    xxh3_128 if installed, else BLAKE3 (mmap + threads for large files), else SHA-256.
+    The file is handed to the hasher as one mmap/C-level read, not a Python chunk loop.
+    Returns the raw digest; hex is only used in the on-disk index.
+    """
+    if not XXHASH_OK and BLAKE3_OK and os.path.getsize(path) > MMAP_HASH_MIN:
+        h = _new_hasher(threaded=True)
+        h.update_mmap(path)
+        return h.digest()
     with open(path, "rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+        _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+        if not (XXHASH_OK or BLAKE3_OK) and hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").digest()
+        h = xxhash.xxh3_128() if XXHASH_OK else _new_hasher(threaded=True)
+        if os.fstat(f.fileno()).st_size:  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+    return h.digest()
 
 # ---------------------------
 # Worker
@@ -277,12 +667,14 @@ class SortWorker(QtCore.QThread):
         parent=None,
     ):
         super().__init__(parent)
-        self.src_folder = Path(src_folder)
-        self.dst_folder = Path(dst_folder)
+        # Plain str paths: the per-file loop joins with os.path, never pathlib
+        self.src_folder = os.fspath(src_folder)
+        self.dst_folder = os.fspath(dst_folder)
         self.recursive = recursive
         self.rename = rename
         self.month_lang = month_lang
         self.template_key = template_key
+        self._fmt = self._make_dest_formatter()  # dt -> date folder path, specialized once per run
         self.simulate = simulate
         self.resume_skip = resume_skip
         self.dup_level = dup_level  # 'off' | 'exact'
@@ -292,63 +684,78 @@ class SortWorker(QtCore.QThread):
         self._stop = False
         self._pause_event = threading.Event()
         self._pause_event.set()
-        self._rows_lock = threading.Lock()
         self._count_lock = threading.Lock()
+        self._dir_lock = threading.Lock()
+        self._dir_cache: Dict[Tuple[int, int, int, str], str] = {}  # (y, m, d, subfolder) -> created dir
 
-        self.rows: List[Dict[str, object]] = []
+        self._row_queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()  # filled lock-free by workers
+        self.rows: List[tuple] = []  # drained from _row_queue when the log is written
         self.count_images = 0
         self.count_videos = 0
         self.count_renamed = 0
         self.total_files = 0
-        self.workers_used = 1  # set by auto-tune
+        self._processed = 0
+        self._pending_status: deque = deque(maxlen=1)  # only the newest per-file message is shown
+        self.copy_workers = 1  # set by auto-tune
+        self.hash_workers = 1  # fingerprint prefetch pool, sized separately from copying
+
+        # Enumerated files as parallel arrays (filled by _collect_files)
+        self._paths: List[str] = []
+        self._sizes = array("q")
+        self._mtimes = array("d")
+        self._stats: List[os.stat_result] = []  # cached DirEntry stats, reused for filesystem dates
+        self._exts: List[str] = []  # lowercased extension with dot
+        self._fps: List[Optional[bytes]] = []  # fast fingerprints, cached/prefetched when dup_level == 'exact'
+        self._fulls: List[Optional[bytes]] = []  # full hashes, cached/prefetched for fingerprints already indexed
+        self._cache_seed: Dict[str, Tuple[bytes, Optional[bytes]]] = {}  # hash-cache hits, to skip rewriting them
+        self._metas: List[Optional[tuple]] = []  # (date, extra) per file, parsed in worker processes for big runs
 
         self._index: Dict[str, Dict[str, object]] = {}
-        self._index_path = self.dst_folder / INDEX_FILENAME
-        self._md5_map: Dict[str, List[str]] = {}
+        self._index_path = os.path.join(self.dst_folder, INDEX_FILENAME)
+        self._fp_map: Dict[bytes, List[str]] = {}   # fast fingerprint -> dest paths
+        self._full_map: Dict[str, bytes] = {}       # dest path -> full-content hash
+        self._unfp_by_size: Dict[int, List[str]] = {}  # size -> dest paths not fingerprinted yet
+        self._dup_sizes: set = set()  # sizes of every indexed dest; other sizes can't be duplicates
 
     # ---- lifecycle ----
     def run(self):
         try:
-            if not self.src_folder.exists():
+            if not os.path.exists(self.src_folder):
                 self.error.emit("Source folder does not exist.")
                 return
-            if not self.dst_folder.exists():
-                self.dst_folder.mkdir(parents=True, exist_ok=True)
+            os.makedirs(self.dst_folder, exist_ok=True)
 
             self._load_index()
-            self._rebuild_md5_from_index()
+            self._rebuild_fp_from_index()
 
-            files = self._collect_files()
-            self.total_files = len(files)
+            self.total_files = self._collect_files()
             if self.total_files == 0:
                 self.status.emit("No media files found.")
                 self.progress.emit(0, 0)
                 log_path = self._write_excel_log(simulation=self.simulate)
                 summary = {
                     "total": 0, "images": 0, "videos": 0, "renamed": 0,
-                    "log_path": str(log_path) if log_path else "", "simulate": self.simulate,
+                    "log_path": log_path or "", "simulate": self.simulate,
                 }
                 self.finished_success.emit(summary)
                 return
 
-            self.workers_used = self._auto_workers(files)
-            self.status.emit(f"Found {self.total_files} media files. Using {self.workers_used} workers (auto-tuned).")
+            self.copy_workers = self._auto_workers()
+            self.hash_workers = self._auto_hash_workers()
+            self.status.emit(
+                f"Found {self.total_files} media files. Using {self.copy_workers} copy / "
+                f"{self.hash_workers} hash workers (auto-tuned)."
+            )
             self.progress.emit(0, self.total_files)
 
-            processed = 0
-            if self.workers_used == 1:
-                for f in files:
-                    if self._stop: break
-                    self._process_one(f)
-                    processed += 1
-                    self.progress.emit(processed, self.total_files)
-            else:
-                with ThreadPoolExecutor(max_workers=self.workers_used) as ex:
-                    futures = [ex.submit(self._process_one, f) for f in files]
-                    for fut in as_completed(futures):
-                        _ = fut.result()
-                        processed += 1
-                        self.progress.emit(processed, self.total_files)
+            self._prefetch_metadata()
+            if self.dup_level == "exact":
+                self._load_hash_cache()
+                self._prefetch_fingerprints()
+            self._process_all()
+            if self.dup_level == "exact":
+                self._save_hash_cache()
+            processed = self._processed
 
             log_path = self._write_excel_log(simulation=self.simulate)
             if not self.simulate:
@@ -359,7 +766,7 @@ class SortWorker(QtCore.QThread):
                 "images": self.count_images,
                 "videos": self.count_videos,
                 "renamed": self.count_renamed,
-                "log_path": str(log_path) if log_path else "",
+                "log_path": log_path or "",
                 "simulate": self.simulate,
             }
             self.finished_success.emit(summary)
@@ -368,6 +775,133 @@ class SortWorker(QtCore.QThread):
 
     def stop(self):
         self._stop = True
+        self._pause_event.set()  # release anything blocked on pause so it can see the stop
+
+    # ---- processing loop ----
+    def _run_indexed(self, fn, workers: int, tick=None):
+        """Run fn(i) for every file index; workers pull the next index from a shared counter.
+
+        The calling thread only waits and calls tick() every PROGRESS_INTERVAL.
+        """
+        next_index = itertools.count()
+        total = self.total_files
+
+        def drain():
+            while not self._stop:
+                i = next(next_index)
+                if i >= total: return
+                fn(i)
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(drain) for _ in range(workers)]
+            pending = futures
+            while pending:
+                _, pending = wait(pending, timeout=PROGRESS_INTERVAL)
+                if tick: tick()
+            for fut in futures: fut.result()
+
+    def _prefetch_fingerprints(self):
+        """Hash candidates up front on the hash pool, ahead of the copy workers.
+
+        Head/tail probes are small random reads bound by storage latency, so a deep
+        queue of concurrent requests lets the device reorder them. When a probe hits
+        a fingerprint already in the index, the full-content hash is computed here
+        too, so copy workers rarely wait on hashing.
+
+        Only size buckets that can hold a duplicate are read: sizes already in the
+        index, or shared by two or more source files.
+        """
+        counts = Counter(self._sizes)
+        candidates = {size for size, n in counts.items() if n > 1}
+        candidates.update(self._dup_sizes.intersection(counts))
+        if not candidates:
+            return
+        n_candidates = sum(counts[size] for size in candidates)
+        self.status.emit(f"Fingerprinting {n_candidates} of {self.total_files} files (possible duplicates)…")
+        probed = [0]
+
+        def probe(i: int):
+            size = self._sizes[i]; path = self._paths[i]
+            # Files resume will skip never reach dedupe, so don't read them
+            if size in candidates and not self._resume_will_skip(i):
+                self._pause_event.wait()
+                try:
+                    fp = self._fps[i]
+                    if fp is None:
+                        fp = self._fps[i] = _fast_fingerprint(path, size)
+                    self._resolve_unfingerprinted(size)
+                    if fp in self._fp_map and self._fulls[i] is None:
+                        self._fulls[i] = file_full_hash(path)
+                except Exception:
+                    pass
+            with self._count_lock:
+                probed[0] += 1
+
+        def tick():
+            self.progress.emit(probed[0], self.total_files)
+
+        self._run_indexed(probe, min(self.hash_workers, self.total_files), tick)
+
+    def _prefetch_metadata(self):
+        """Parse dates/EXIF in worker processes for large runs.
+
+        exifread and the container parsers are pure Python and hold the GIL, so
+        threads cannot overlap them. This thread only proxies results and progress,
+        and feeds the pool a few chunks at a time so pause and stop take effect
+        once the chunks already in flight finish. Any pool failure (or a stop)
+        leaves _metas empty and the copy workers parse in-thread.
+        """
+        procs = min(os.cpu_count() or 1, METADATA_MAX_PROCS)
+        if self.total_files < METADATA_MP_MIN_FILES or procs < 2:
+            return
+        self.status.emit(f"Reading metadata of {self.total_files} files with {procs} processes…")
+        metas: List[Optional[tuple]] = [None] * self.total_files
+        tasks = zip(self._paths, self._stats, self._exts)
+        pending: deque = deque()  # (first file index, future), in submission order
+        queued = 0
+        last = time.monotonic()
+        try:
+            # spawn: forking a process that runs Qt threads is unsafe
+            with ProcessPoolExecutor(procs, mp_context=multiprocessing.get_context("spawn")) as ex:
+                def feed():
+                    nonlocal queued
+                    batch = list(itertools.islice(tasks, METADATA_CHUNK))
+                    if batch:
+                        pending.append((queued, ex.submit(_metadata_chunk, batch))); queued += len(batch)
+
+                for _ in range(procs * METADATA_CHUNKS_PER_PROC): feed()
+                while pending:
+                    start, fut = pending.popleft()
+                    results = fut.result()
+                    metas[start:start + len(results)] = results
+                    while not self._pause_event.wait(PROGRESS_INTERVAL):  # paused: submit nothing new
+                        if self._stop: break
+                    if self._stop:
+                        ex.shutdown(wait=False, cancel_futures=True)
+                        return
+                    feed()
+                    now = time.monotonic()
+                    if now - last >= PROGRESS_INTERVAL:
+                        self.progress.emit(start + len(results), self.total_files); last = now
+        except Exception:
+            return
+        self._metas = metas
+        self.progress.emit(0, self.total_files)
+
+    def _process_all(self):
+        def process(i: int):
+            self._process_one(i)
+            with self._count_lock:
+                self._processed += 1
+
+        self._run_indexed(process, self.copy_workers, self._emit_progress)
+
+    def _emit_progress(self):
+        try:
+            self.status.emit(self._pending_status.pop())
+        except IndexError:
+            pass
+        self.progress.emit(self._processed, self.total_files)
 
     def pause(self):
         self._pause_event.clear()
@@ -376,14 +910,10 @@ class SortWorker(QtCore.QThread):
         self._pause_event.set()
 
     # ---- auto-tune workers ----
-    def _auto_workers(self, files: List[Path]) -> int:
+    def _auto_workers(self) -> int:
         base = min(6, max(2, (os.cpu_count() or 4)))
         try:
-            sample = files[: min(60, len(files))]
-            sizes = []
-            for p in sample:
-                try: sizes.append(p.stat().st_size)
-                except Exception: pass
+            sizes = list(self._sizes[:60])
             if not sizes: return base
             sizes.sort()
             mid = len(sizes) // 2
@@ -394,130 +924,288 @@ class SortWorker(QtCore.QThread):
                 workers = base
             else:
                 workers = max(2, base - 1)
-            if str(self.src_folder).startswith("\\\\") or str(self.dst_folder).startswith("\\\\"):
+            if self.src_folder.startswith("\\\\"):
                 workers = min(workers, 3)
+            if _is_slow_target(self.dst_folder):  # network share or spinning disk: parallel writes thrash
+                workers = min(workers, 2)
             return max(1, workers)
         except Exception:
             return base
 
+    def _auto_hash_workers(self) -> int:
+        # Head/tail probes are small latency-bound reads: many in flight suit SSD/NVMe
+        workers = min(32, (os.cpu_count() or 4) * 2)
+        if _is_slow_target(self.src_folder):
+            workers = min(workers, 4)
+        return workers
+
     # ---- file enumeration ----
-    def _collect_files(self) -> List[Path]:
-        files: List[Path] = []
-        if self.recursive:
-            for root, _, filenames in os.walk(self.src_folder):
-                for name in filenames:
-                    p = Path(root) / name
-                    if is_media_file(p): files.append(p)
-        else:
-            for p in self.src_folder.iterdir():
-                if is_media_file(p): files.append(p)
-        return files
+    def _collect_files(self) -> int:
+        """Fill the path/size/mtime/stat/ext arrays from one scandir pass; returns the file count."""
+        paths = self._paths; sizes = self._sizes; mtimes = self._mtimes; stats = self._stats; exts = self._exts
+        # Absolute root -> every entry.path is absolute and doubles as the resume-index key
+        for entry in _scandir_walk(os.path.abspath(self.src_folder), self.recursive):
+            name = entry.name
+            dot = name.rfind(".")
+            if dot <= 0:  # no extension, or a dotfile like ".jpg"
+                continue
+            ext = name[dot:].lower()
+            if not is_media_file(ext):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            paths.append(entry.path); sizes.append(st.st_size); mtimes.append(st.st_mtime); stats.append(st); exts.append(ext)
+        return len(paths)
 
     # ---- path building ----
-    def _month_name(self, dt: datetime) -> str:
-        if getattr(self, "month_lang", "en") == "id":
-            return ID_MONTHS.get(dt.month, dt.strftime("%B"))
-        return dt.strftime("%B")
-
-    def _month_abbr(self, dt: datetime) -> str:
-        if getattr(self, "month_lang", "en") == "id":
-            return ID_MONTHS_ABBR.get(dt.month, dt.strftime("%b"))
-        return dt.strftime("%b")
-
-    def _build_dest_dir(self, dt: datetime) -> Path:
+    def _make_dest_formatter(self):
         # 'ymd_name' -> YYYY/MonthName/DD
         # 'ymd_mm'   -> YYYY/MM/DD
         # 'ymd_mon'  -> YYYY/Mon/DD
-        yyyy = dt.strftime("%Y"); mm = dt.strftime("%m"); dd = dt.strftime("%d")
+        base = os.path.join(self.dst_folder, ""); sep = os.sep
         if self.template_key == "ymd_mm":
-            parts = [yyyy, mm, dd]
-        elif self.template_key == "ymd_mon":
-            parts = [yyyy, self._month_abbr(dt), dd]
+            return lambda d: f"{base}{d.year:04d}{sep}{d.month:02d}{sep}{d.day:02d}"
+        indonesian = self.month_lang == "id"
+        if self.template_key == "ymd_mon":
+            table = ID_MONTHS_ABBR if indonesian else EN_MONTHS_ABBR
         else:  # default 'ymd_name'
-            parts = [yyyy, self._month_name(dt), dd]
-        dest = self.dst_folder
-        for seg in parts: dest = dest / seg
-        return dest
+            table = ID_MONTHS if indonesian else EN_MONTHS
+        months = tuple(table[m] for m in range(1, 13))
+        return lambda d: f"{base}{d.year:04d}{sep}{months[d.month - 1]}{sep}{d.day:02d}"
+
+    def _dest_dir_for(self, dt: datetime, sub: str = "") -> str:
+        """Date folder (or a subfolder inside it), created once per run and memoized."""
+        key = (dt.year, dt.month, dt.day, sub)
+        path = self._dir_cache.get(key)
+        if path is None:
+            with self._dir_lock:
+                path = self._dir_cache.get(key)
+                if path is None:
+                    path = self._fmt(dt)
+                    if sub: path = os.path.join(path, sub)
+                    os.makedirs(path, exist_ok=True)
+                    self._dir_cache[key] = path
+        return path
+
+    # ---- persistent hash cache ----
+    def _open_hash_cache(self) -> sqlite3.Connection:
+        con = sqlite3.connect(os.path.join(self.dst_folder, HASH_CACHE_FILENAME))
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS hash_cache (path TEXT NOT NULL, algo TEXT NOT NULL, size INTEGER, "
+            "mtime_ns INTEGER, fp BLOB, full BLOB, PRIMARY KEY (path, algo))"
+        )
+        return con
+
+    def _load_hash_cache(self):
+        """Seed _fps/_fulls for source files whose size and mtime_ns match a cached entry.
+
+        Keyed by source path: Windows scandir stats carry no inode number.
+        """
+        self._fps = [None] * self.total_files
+        self._fulls = [None] * self.total_files
+        self._cache_seed = {}
+        try:
+            con = self._open_hash_cache()
+            try:
+                cached = {
+                    path: (size, mtime_ns, fp, full) for path, size, mtime_ns, fp, full in con.execute(
+                        "SELECT path, size, mtime_ns, fp, full FROM hash_cache WHERE algo = ?", (HASH_ALGO,))
+                }
+            finally:
+                con.close()
+        except sqlite3.Error:
+            return
+        for i, path in enumerate(self._paths):
+            hit = cached.get(path)
+            if hit and hit[0] == self._sizes[i] and hit[1] == self._stats[i].st_mtime_ns and hit[2]:
+                self._fps[i] = hit[2]; self._fulls[i] = hit[3]
+                self._cache_seed[path] = (hit[2], hit[3])
+
+    def _save_hash_cache(self):
+        seed = self._cache_seed
+        rows = [
+            (path, HASH_ALGO, self._sizes[i], self._stats[i].st_mtime_ns, fp, full)
+            for i, (path, fp, full) in enumerate(zip(self._paths, self._fps, self._fulls))
+            if fp is not None and seed.get(path) != (fp, full)
+        ]
+        if not rows: return
+        try:
+            con = self._open_hash_cache()
+            try:
+                with con:
+                    con.executemany("INSERT OR REPLACE INTO hash_cache VALUES (?, ?, ?, ?, ?, ?)", rows)
+            finally:
+                con.close()
+        except sqlite3.Error:
+            pass
 
     # ---- dedupe index ----
-    def _rebuild_md5_from_index(self):
-        self._md5_map.clear()
+    def _rebuild_fp_from_index(self):
+        self._fp_map.clear(); self._full_map.clear(); self._unfp_by_size.clear(); self._dup_sizes.clear()
         for rec in self._index.values():
-            md5 = rec.get("md5")
-            if md5:
-                self._md5_map.setdefault(str(md5), []).append(rec.get("dest", ""))
+            dest = str(rec.get("dest", ""))
+            try:
+                size = int(rec["size"])
+            except Exception:
+                continue
+            self._dup_sizes.add(size)
+            try:
+                fp = bytes.fromhex(rec["fp"]) if rec.get("fp") else None
+                full = bytes.fromhex(rec["hash"]) if rec.get("hash") else None
+            except (TypeError, ValueError):
+                fp = full = None
+            if fp:
+                self._fp_map.setdefault(fp, []).append(dest)
+            else:
+                self._unfp_by_size.setdefault(size, []).append(dest)
+            if full:
+                self._full_map[dest] = full
+
+    def _resolve_unfingerprinted(self, size: int):
+        """Same-size dests indexed without a fingerprint get one now, lazily."""
+        for dest in self._unfp_by_size.pop(size, ()):
+            try:
+                self._fp_map.setdefault(_fast_fingerprint(dest, size), []).append(dest)
+            except OSError:
+                pass
 
-    def _detect_exact_duplicate(self, src_path: Path) -> Tuple[bool, str, Optional[str]]:
+    def _find_full_match(self, fp: bytes, full: bytes) -> str:
+        """Indexed dest with this fingerprint whose full-content hash equals `full`, else ''."""
+        for dest in self._fp_map.get(fp, ()):
+            dest_full = self._full_map.get(dest)
+            if dest_full is None and os.path.exists(dest):
+                dest_full = file_full_hash(dest)
+                self._full_map[dest] = dest_full
+            if dest_full == full:
+                return dest
+        return ""
+
+    def _detect_exact_duplicate(
+        self, src_path: str, size: int, fp: Optional[bytes] = None, full: Optional[bytes] = None
+    ) -> Tuple[bool, str, Optional[bytes], Optional[bytes]]:
+        """Two-stage check: fast fingerprint first, full hash only on collision (either may be prefetched).
+
+        A size no indexed file has cannot be a duplicate, so nothing is read at all.
+        """
         if self.dup_level != "exact":
-            return False, "", None
+            return False, "", None, None
+        if size not in self._dup_sizes:
+            return False, "", fp, full  # keep prefetched/cached hashes for the index
         try:
-            md5_hex = file_md5(src_path)
-            hits = self._md5_map.get(md5_hex)
-            if hits:
-                return True, hits[0], md5_hex
-            return False, "", md5_hex
+            if fp is None:
+                fp = _fast_fingerprint(src_path, size)
+            self._resolve_unfingerprinted(size)
+            if fp not in self._fp_map:
+                return False, "", fp, full
+            if full is None:
+                full = file_full_hash(src_path)
+            dest = self._find_full_match(fp, full)
+            return bool(dest), dest, fp, full
         except Exception:
-            return False, "", None
-
-    def _update_index(self, src_path: Path, size: int, mtime: float, dest_path: Path, md5_hex: Optional[str]):
-        key = str(src_path.resolve())
-        rec: Dict[str, object] = {"size": int(size), "mtime": float(mtime), "dest": str(dest_path)}
-        if md5_hex:
-            rec["md5"] = md5_hex
-            self._md5_map.setdefault(md5_hex, []).append(str(dest_path))
+            return False, "", None, None
+
+    def _update_index(self, src_path: str, size: int, mtime: float, dest_path: str,
+                      fp: Optional[bytes], full: Optional[bytes]):
+        key = src_path  # absolute from enumeration; no realpath syscalls
+        rec: Dict[str, object] = {"size": int(size), "mtime": float(mtime), "dest": dest_path}
+        if fp:
+            rec["fp"] = fp.hex()
+            self._fp_map.setdefault(fp, []).append(dest_path)
+        else:
+            self._unfp_by_size.setdefault(int(size), []).append(dest_path)
+        self._dup_sizes.add(int(size))
+        if full:
+            rec["hash"] = full.hex()
+            self._full_map[dest_path] = full
         self._index[key] = rec
 
-    def _should_skip_resume(self, src_path: Path, size: int, mtime: float) -> Tuple[bool, str]:
+    def _should_skip_resume(self, src_path: str, size: int, mtime: float) -> Tuple[bool, str]:
         if not self.resume_skip: return False, ""
-        key = str(src_path.resolve()); rec = self._index.get(key)
+        rec = self._index.get(src_path)
         if not rec: return False, ""
         try:
             if int(rec.get("size", -1)) == size and abs(float(rec.get("mtime", 0)) - mtime) < 0.5:
-                dest = Path(str(rec.get("dest", "")))
-                if dest.exists(): return True, str(rec.get("dest", ""))
+                dest = str(rec.get("dest", ""))
+                if os.path.exists(dest): return True, dest
         except Exception: pass
         return False, ""
 
     # ---- per-file processing ----
-    def _process_one(self, src_path: Path):
-        if self._stop: return
+    def _new_name(self, name: str, cdt: datetime) -> str:
+        return f"{cdt:%d-%m-%Y}-{name}" if self.rename else name
+
+    def _already_at_destination(self, i: int, planned: str) -> bool:
+        """A file with the source's size and mtime (copies keep it) is already at `planned`."""
+        try:
+            dst_st = os.stat(planned)
+        except OSError:
+            return False
+        return dst_st.st_size == self._sizes[i] and dst_st.st_mtime_ns == self._stats[i].st_mtime_ns
+
+    def _resume_will_skip(self, i: int) -> bool:
+        """Prefetch-time version of the resume checks in _process_one (planned path needs prefetched metadata)."""
+        src = self._paths[i]
+        if self._should_skip_resume(src, self._sizes[i], self._mtimes[i])[0]:
+            return True
+        meta = self._metas[i] if self._metas else None
+        if not (self.resume_skip and meta):
+            return False
+        cdt = meta[0]
+        return self._already_at_destination(i, os.path.join(self._fmt(cdt), self._new_name(os.path.basename(src), cdt)))
+
+    def _process_one(self, i: int):
         while not self._pause_event.is_set(): time.sleep(0.05)
+        if self._stop: return
+        src = self._paths[i]
+        name = os.path.basename(src)
         try:
-            stat = src_path.stat()
-            size = stat.st_size; mtime = stat.st_mtime
+            size = self._sizes[i]; mtime = self._mtimes[i]
 
-            cdt, extra = best_creation_datetime(src_path)
-            dest_dir = self._build_dest_dir(cdt)
-            dest_dir.mkdir(parents=True, exist_ok=True)
+            ext = self._exts[i]
+            meta = self._metas[i] if self._metas else None
+            cdt, extra = meta or best_creation_datetime(src, self._stats[i], ext)
+            dest_dir = self._dest_dir_for(cdt)
 
-            new_name = src_path.name
-            if self.rename:
-                formatted_date = f"{cdt:%d-%m-%Y}"
-                new_name = f"{formatted_date}-{src_path.name}"
-            dest_path = ensure_unique_path(dest_dir / new_name)
+            new_name = self._new_name(name, cdt)
+            planned = os.path.join(dest_dir, new_name)
 
             # Resume skip
             if self.resume_skip:
-                skip, prev_dest = self._should_skip_resume(src_path, size, mtime)
+                skip, prev_dest = self._should_skip_resume(src, size, mtime)
                 if skip:
-                    self._append_row(src_path, dest_dir, new_name, cdt, extra, "Skipped", size, "")
-                    self.status.emit(f"Skipped ▶ {src_path.name} (already copied)")
-                    self._update_counts(src_path)
+                    self._append_row(src, dest_dir, new_name, cdt, extra, "Skipped", size, "")
+                    self._pending_status.append(f"Skipped ▶ {name} (already copied)")
+                    self._update_counts(ext)
+                    return
+                # Not in the index, but an earlier copy already sits at the planned path: skip before any hashing
+                if self._already_at_destination(i, planned):
+                    if not self.simulate:
+                        self._update_index(src, size, mtime, planned, None, None)
+                    self._append_row(src, dest_dir, new_name, cdt, extra, "Skipped", size, "")
+                    self._pending_status.append(f"Skipped ▶ {name} (already at destination)")
+                    self._update_counts(ext)
                     return
+            dest_path = ensure_unique_path(planned)
 
             # Exact duplicate handling
-            is_dup, dup_path, md5_hex = self._detect_exact_duplicate(src_path)
-            action = "Copied"; planned_dest = str(dest_path); do_copy = True; duplicate_of = ""
+            if self._fps:
+                is_dup, dup_path, fp, full = self._detect_exact_duplicate(src, size, self._fps[i], self._fulls[i])
+                self._fps[i] = fp; self._fulls[i] = full  # for the hash cache
+            else:
+                is_dup, dup_path, fp, full = self._detect_exact_duplicate(src, size)
+            action = "Copied"; do_copy = True; duplicate_of = ""
             if is_dup:
                 duplicate_of = dup_path or ""
                 if self.dup_action == "skip":
                     action = "Duplicate-Skipped"; do_copy = False
                 elif self.dup_action == "folder":
                     # Place inside date folder: <dest_dir>/<dup_folder>/<file>
-                    dup_dir = dest_dir / self.dup_folder
-                    dup_dir.mkdir(parents=True, exist_ok=True)
-                    dest_path = ensure_unique_path(dup_dir / new_name)
-                    planned_dest = str(dest_path)
+                    dup_dir = self._dest_dir_for(cdt, self.dup_folder)
+                    dest_path = ensure_unique_path(os.path.join(dup_dir, new_name))
                     action = f"Duplicate→{self.dup_folder}"
                 else:
                     action = "Duplicate-Kept"  # keep both
@@ -526,29 +1214,28 @@ class SortWorker(QtCore.QThread):
                 action = f"Simulated-{action}"; do_copy = False
 
             if do_copy:
-                shutil.copy2(to_long_path(src_path), to_long_path(dest_path))
+                _fast_copy(to_long_path(src), to_long_path(dest_path), size)
                 if not self.simulate:
-                    self._update_index(src_path, size, mtime, dest_path, md5_hex)
+                    self._update_index(src, size, mtime, dest_path, fp, full)
                 if self.rename:
                     with self._count_lock:
                         self.count_renamed += 1
 
-            self._append_row(src_path, dest_dir, new_name, cdt, extra, action, size, duplicate_of)
-            self.status.emit(f"{action} ▶ {src_path.name} → {planned_dest}")
-            self._update_counts(src_path)
+            self._append_row(src, dest_dir, new_name, cdt, extra, action, size, duplicate_of)
+            self._pending_status.append(f"{action} ▶ {name} → {dest_path}")
+            self._update_counts(ext)
         except Exception as e:
-            self.status.emit(f"Error: {src_path.name} — {e}")
+            self._pending_status.append(f"Error: {name} — {e}")
 
-    def _update_counts(self, src_path: Path):
-        ext = src_path.suffix.lower()
+    def _update_counts(self, ext: str):
         with self._count_lock:
             if ext in IMAGE_EXTS: self.count_images += 1
             elif ext in VIDEO_EXTS: self.count_videos += 1
 
     def _append_row(
         self,
-        src_path: Path,
-        dest_dir: Path,
+        src_path: str,
+        dest_dir: str,
         new_name: str,
         cdt: datetime,
         extra: Dict[str, Optional[object]],
@@ -556,101 +1243,117 @@ class SortWorker(QtCore.QThread):
         size: int,
         duplicate_of: str,
     ):
-        now_ts = datetime.now()
-        row: Dict[str, object] = {
-            "Timestamp": now_ts,
-            "Source folder": str(src_path.parent),
-            "Destination Folder": str(dest_dir),
-            "Filename": src_path.name,
-            "New Filename": new_name if self.rename else "",
-            "Creation Date": cdt.date(),
-            "Creation Time": cdt.time().replace(microsecond=0),
-            "Action": action,
-            "Size (bytes)": size,
-            "Width": extra.get("width"),
-            "Height": extra.get("height"),
-            "Duration (sec)": extra.get("duration"),
-            "Camera Make": extra.get("camera_make"),
-            "Camera Model": extra.get("camera_model"),
-            "Lens": extra.get("lens"),
-            "GPS Lat": extra.get("gps_lat"),
-            "GPS Lon": extra.get("gps_lon"),
-            "Duplicate Of": duplicate_of,
-        }
-        with self._rows_lock:
-            self.rows.append(row)
+        self._row_queue.put((
+            datetime.now(),
+            os.path.dirname(src_path),
+            dest_dir,
+            os.path.basename(src_path),
+            new_name if self.rename else "",
+            cdt.date(),
+            cdt.time().replace(microsecond=0),
+            action,
+            size,
+            extra.get("width"),
+            extra.get("height"),
+            extra.get("duration"),
+            extra.get("camera_make"),
+            extra.get("camera_model"),
+            extra.get("lens"),
+            extra.get("gps_lat"),
+            extra.get("gps_lon"),
+            duplicate_of,
+        ))
+
+    def _drain_rows(self):
+        while True:
+            try:
+                yield self._row_queue.get_nowait()
+            except queue.Empty:
+                break
 
     # ---- Excel log ----
-    def _write_excel_log(self, simulation: bool = False) -> Optional[Path]:
-        wb = Workbook(); ws = wb.active; ws.title = "Log"
-        headers = [
-            "Timestamp","Source folder","Destination Folder","Filename","New Filename",
-            "Creation Date","Creation Time","Action","Size (bytes)","Width","Height",
-            "Duration (sec)","Camera Make","Camera Model","Lens","GPS Lat","GPS Lon","Duplicate Of",
-        ]
-        ws.append(headers)
-        bold_font = Font(bold=True)
-        for col_idx in range(1, len(headers) + 1):
-            ws.cell(row=1, column=col_idx).font = bold_font
+    def _write_excel_log(self, simulation: bool = False) -> Optional[str]:
+        # Write-only workbook: rows stream straight to XML, no per-cell objects kept in memory
+        wb = Workbook(write_only=True); ws = wb.create_sheet("Log")
+        headers = LOG_HEADERS
+        self.rows.extend(self._drain_rows())
+
+        # Auto width (write-only sheets need column dimensions before the first row)
+        max_widths = [len(h) for h in headers]
+        for vals in self.rows:
+            for j, val in enumerate(vals):
+                n = len(str(val))
+                if n > max_widths[j]: max_widths[j] = n
+        for col, max_len in enumerate(max_widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = min(max_len + 2, 60)
 
+        bold_font = Font(bold=True)
+        def bold(value):
+            c = WriteOnlyCell(ws, value=value); c.font = bold_font
+            return c
+        ws.append([bold(h) for h in headers])
+
+        # Formats are set per cell at write time (Timestamp, Creation Date, Creation Time)
+        formats = {
+            COL["Timestamp"]: "dd:mmmm:yyyy hh:mm:ss",
+            COL["Creation Date"]: "dd-mm-yyyy",
+            COL["Creation Time"]: "hh:mm:ss",
+        }
+        fmt_items = tuple(formats.items())
         for r in self.rows:
-            ws.append([
-                r.get("Timestamp"), r.get("Source folder"), r.get("Destination Folder"),
-                r.get("Filename"), r.get("New Filename"), r.get("Creation Date"),
-                r.get("Creation Time"), r.get("Action"), r.get("Size (bytes)"),
-                r.get("Width"), r.get("Height"), r.get("Duration (sec)"),
-                r.get("Camera Make"), r.get("Camera Model"), r.get("Lens"),
-                r.get("GPS Lat"), r.get("GPS Lon"), r.get("Duplicate Of"),
-            ])
-
-        # Formats
-        for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=1):
-            for cell in row: cell.number_format = "dd:mmmm:yyyy hh:mm:ss"
-        for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=6, max_col=6):
-            for cell in row: cell.number_format = "dd-mm-yyyy"
-        for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=7, max_col=7):
-            for cell in row: cell.number_format = "hh:mm:ss"
-
-        # Auto width
-        from openpyxl.utils import get_column_letter
-        for col in range(1, len(headers) + 1):
-            max_len = 0
-            for row in range(1, ws.max_row + 1):
-                val = ws.cell(row=row, column=col).value
-                try: max_len = max(max_len, len(str(val)))
-                except Exception: pass
-            ws.column_dimensions[get_column_letter(col)].width = min(max_len + 2, 60)
+            vals = list(r)
+            for j, fmt in fmt_items:
+                c = WriteOnlyCell(ws, value=r[j]); c.number_format = fmt
+                vals[j] = c
+            ws.append(vals)
 
         # One blank row, then bold summary
-        summary_start = ws.max_row + 2
-        ws.cell(row=summary_start, column=1, value="Summary").font = Font(bold=True)
-        ws.cell(row=summary_start, column=2, value=f"Total files: {len(self.rows)}").font = Font(bold=True)
-        ws.cell(row=summary_start, column=3, value=f"Images: {self.count_images}").font = Font(bold=True)
-        ws.cell(row=summary_start, column=4, value=f"Videos: {self.count_videos}").font = Font(bold=True)
-        ws.cell(row=summary_start, column=5, value=f"Renamed: {self.count_renamed}").font = Font(bold=True)
-        ws.cell(row=summary_start, column=6, value=f"Workers: {self.workers_used}").font = Font(bold=True)
-        ws.cell(row=summary_start, column=7, value=f"Mode: {'Simulate' if simulation else 'Copy'}").font = Font(bold=True)
+        ws.append([])
+        ws.append([bold(v) for v in (
+            "Summary",
+            f"Total files: {len(self.rows)}",
+            f"Images: {self.count_images}",
+            f"Videos: {self.count_videos}",
+            f"Renamed: {self.count_renamed}",
+            f"Workers: {self.copy_workers} copy / {self.hash_workers} hash",
+            f"Mode: {'Simulate' if simulation else 'Copy'}",
+        )])
 
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         prefix = "Simulation_Log_" if simulation else "Sort_Log_"
         log_name = f"{prefix}{stamp}.xlsx"
-        log_path = self.dst_folder / log_name
+        log_path = os.path.join(self.dst_folder, log_name)
         wb.save(log_path)
         return log_path
 
     # ---- index persistence ----
     def _load_index(self):
         try:
-            if self._index_path.exists():
-                with open(self._index_path, "r", encoding="utf-8") as f:
-                    self._index = json.load(f)
+            if os.path.exists(self._index_path):
+                with open(self._index_path, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if ORJSON_OK else json.loads(raw)
+                if data.get("version") == INDEX_VERSION and data.get("algo") == HASH_ALGO:
+                    self._index = data.get("files", {})
+                else:
+                    # Older (MD5) or other-hasher index: keep resume data, drop stale fingerprints
+                    files = data.get("files", {}) if "version" in data else data
+                    self._index = {
+                        k: {f: rec[f] for f in ("size", "mtime", "dest") if f in rec}
+                        for k, rec in files.items() if isinstance(rec, dict)
+                    }
         except Exception:
             self._index = {}
 
     def _save_index(self):
         try:
-            with open(self._index_path, "w", encoding="utf-8") as f:
-                json.dump(self._index, f, ensure_ascii=False, indent=2)
+            data = {"version": INDEX_VERSION, "algo": HASH_ALGO, "files": self._index}
+            if ORJSON_OK:
+                with open(self._index_path, "wb") as f:
+                    f.write(orjson.dumps(data))
+            else:
+                with open(self._index_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
         except Exception:
             pass
 
@@ -680,6 +1383,45 @@ class PathPicker(QtWidgets.QWidget):
             path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select File")
         if path: self.le.setText(path)
 
+class LogTableModel(QtCore.QAbstractTableModel):
+    """Read-only preview over the worker's log row tuples; nothing is copied or wrapped per cell."""
+    HEADERS = ("Filename", "Action", "Planned/New Name", "Destination Folder", "Duplicate Of")
+    SOURCE_COLS = (COL["Filename"], COL["Action"], COL["New Filename"], COL["Destination Folder"], COL["Duplicate Of"])
+    ALIGN = tuple(
+        QtCore.Qt.AlignCenter if h == "Action" else QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft for h in HEADERS
+    )
+    TOOLTIP = tuple(h != "Action" for h in HEADERS)  # long names/paths get a tooltip
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows  # the worker's list as-is
+        self.endResetModel()
+
+    def clear(self): self.set_rows([])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        col = index.column()
+        if role == QtCore.Qt.DisplayRole or (role == QtCore.Qt.ToolTipRole and self.TOOLTIP[col]):
+            return self._rows[index.row()][self.SOURCE_COLS[col]]
+        if role == QtCore.Qt.TextAlignmentRole:
+            return self.ALIGN[col]
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
@@ -689,6 +1431,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.worker: Optional[SortWorker] = None
         self.current_log_path: Optional[str] = None
+        self._pending_status: Optional[str] = None  # newest worker status, shown at most every 100 ms
 
         central = QtWidgets.QWidget(); self.setCentralWidget(central)
         v = QtWidgets.QVBoxLayout(central); v.setContentsMargins(18, 18, 18, 18); v.setSpacing(14)
@@ -730,7 +1473,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Duplicate detection + action
         self.cmb_dup_level = QtWidgets.QComboBox()
         self.cmb_dup_level.addItem("Off (default)", userData="off")
-        self.cmb_dup_level.addItem("Exact (MD5) - detect duplicates", userData="exact")
+        self.cmb_dup_level.addItem("Exact (content hash) - detect duplicates", userData="exact")
         self.cmb_dup_action = QtWidgets.QComboBox()
         self.cmb_dup_action.addItem("Skip duplicates", userData="skip")
         self.cmb_dup_action.addItem("Keep both (rename if needed)", userData="keep")
@@ -765,12 +1508,12 @@ class MainWindow(QtWidgets.QMainWindow):
         v.addWidget(self.progress); v.addWidget(self.lbl_status)
 
         # Log/Preview table
-        self.table_preview = QtWidgets.QTableWidget(0, 5)
-        self.table_preview.setHorizontalHeaderLabels(
-            ["Filename", "Action", "Planned/New Name", "Destination Folder", "Duplicate Of"]
-        )
+        self.table_model = LogTableModel(self)
+        self.table_preview = QtWidgets.QTableView()
+        self.table_preview.setModel(self.table_model)
         header = self.table_preview.horizontalHeader()
         header.setStretchLastSection(False)
+        header.setResizeContentsPrecision(200)  # ResizeToContents samples ~200 rows, not the whole model
         # Column sizing strategy for readability
         header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)  # Filename
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeToContents)  # Action
@@ -796,7 +1539,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # Helpers
     def clear_log_screen(self):
-        self.table_preview.setRowCount(0)
+        self.table_model.clear()
 
     # Actions
     def _start_with_settings(self, simulate: bool):
@@ -804,7 +1547,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not src or not dst:
             QtWidgets.QMessageBox.warning(self, APP_TITLE, "Please choose both Source and Destination folders.")
             return False
-        if Path(src) == Path(dst):
+        if os.path.exists(src) and os.path.exists(dst) and os.path.samefile(src, dst):
             QtWidgets.QMessageBox.warning(self, APP_TITLE, "Destination must be different from Source.")
             return False
 
@@ -865,7 +1608,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.progress.setMaximum(max(total, 1)); self.progress.setValue(processed)
 
     def on_status(self, msg: str):
-        self.lbl_status.setText(msg)
+        if self._pending_status is None:
+            QtCore.QTimer.singleShot(100, self._flush_status)
+        self._pending_status = msg
+
+    def _flush_status(self):
+        if self._pending_status is not None:
+            self.lbl_status.setText(self._pending_status)
+            self._pending_status = None
 
     def on_error(self, err: str):
         QtWidgets.QMessageBox.critical(self, APP_TITLE, f"Error: {err}")
@@ -886,31 +1636,17 @@ class MainWindow(QtWidgets.QMainWindow):
             f"Done [{mode}]. Processed: {total} | Images: {imgs} | Videos: {vids} | Renamed: {ren}.\n"
             f"Log saved to: {self.current_log_path or '(not created)'}"
         )
+        self._pending_status = None  # a buffered worker message must not overwrite the summary
         self.lbl_status.setText(msg)
 
         if self.worker and hasattr(self.worker, "rows"):
-            rows = self.worker.rows
-            self.table_preview.setRowCount(len(rows))
-            for i, r in enumerate(rows):
-                vals = [
-                    r.get("Filename", ""),
-                    r.get("Action", ""),
-                    r.get("New Filename", ""),
-                    r.get("Destination Folder", ""),
-                    r.get("Duplicate Of", ""),
-                ]
-                for j, val in enumerate(vals):
-                    item = QtWidgets.QTableWidgetItem(str(val))
-                    # Align columns nicely
-                    if j == 1:  # Action
-                        item.setTextAlignment(QtCore.Qt.AlignCenter)
-                    else:
-                        item.setTextAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-                    # Long paths get tooltip
-                    if j in (0, 2, 3, 4):
-                        item.setToolTip(str(val))
-                    self.table_preview.setItem(i, j, item)
-            self.table_preview.resizeColumnsToContents()
+            table = self.table_preview
+            sorting = table.isSortingEnabled()
+            table.setUpdatesEnabled(False); table.setSortingEnabled(False)
+            try:
+                self.table_model.set_rows(self.worker.rows)
+            finally:
+                table.setSortingEnabled(sorting); table.setUpdatesEnabled(True)
 
     def open_log(self):
         if self.current_log_path and os.path.exists(self.current_log_path):
@@ -925,4 +1661,5 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # metadata processes in frozen (PyInstaller) builds
     main()